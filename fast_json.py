@@ -0,0 +1,52 @@
+"""JSON helpers backed by orjson when available, stdlib json otherwise.
+
+Both backends emit UTF-8 encoded ``bytes`` pretty-printed with a two space
+indent, so callers write to files opened in binary mode.
+"""
+import json
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to indented JSON bytes"""
+        return orjson.dumps(obj, option=_OPTIONS)
+
+    def dumps_text(obj: Any) -> str:
+        """Serialize obj to indented JSON text for embedding in documents"""
+        return orjson.dumps(obj, option=_OPTIONS).decode('utf-8')
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from bytes or str"""
+        return orjson.loads(data)
+else:
+    # One shared encoder instead of building a new JSONEncoder per call
+    _PRETTY = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to indented JSON bytes"""
+        return _PRETTY.encode(obj).encode('utf-8')
+
+    def dumps_text(obj: Any) -> str:
+        """Serialize obj to indented JSON text for embedding in documents"""
+        return _PRETTY.encode(obj)
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
+
+def dump(obj: Any, f: BinaryIO):
+    """Serialize obj to a file opened in binary mode"""
+    f.write(dumps(obj))
+
+def load(f: BinaryIO) -> Any:
+    """Parse JSON from a file opened in binary mode"""
+    return loads(f.read())
@@ -1,9 +1,9 @@
-import yaml
-import json
+import fast_json
+import io
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Set, Tuple, TypedDict
+from dataclasses import dataclass, asdict
 import re
 from datetime import datetime
 import logging
@@ -12,12 +12,18 @@ import logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(levelname)s - %(message)s')
 
-@dataclass
-class ApiExample:
+class ApiExample(TypedDict):
     request: Dict
     response: Dict
     description: str
 
+# Validation patterns compiled once at import, keyed by rule type
+_COMPILED_PATTERNS = {
+    'ip': re.compile(r"^(\d{1,3}\.){3}\d{1,3}(/\d{1,2})?$"),
+    'mac': re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"),
+    'interface': re.compile(r"^[a-zA-Z0-9-_]+$"),
+}
+
 @dataclass
 class ValidationRule:
     type: str
@@ -25,8 +31,21 @@ class ValidationRule:
     description: str
     example: str
 
+    @property
+    def compiled(self) -> re.Pattern:
+        """Precompiled regex for this rule's pattern"""
+        # A property rather than a field keeps __dict__ JSON serializable
+        compiled = _COMPILED_PATTERNS.get(self.type)
+        if compiled is None or compiled.pattern != self.pattern:
+            compiled = re.compile(self.pattern)
+        return compiled
+
 class ExampleGenerator:
-    """Generates realistic examples for each API endpoint"""
+    """Generates realistic examples for each API endpoint
+
+    Values in example_values may be edited in place; assign a new dict to
+    add or remove hint keys so the lookup tables are rebuilt.
+    """
     
     def __init__(self):
         self.example_values = {
@@ -44,6 +63,19 @@ class ExampleGenerator:
             'vlan': 100,
         }
 
+    @property
+    def example_values(self) -> Dict[str, Any]:
+        """Example values keyed by parameter name hint or type"""
+        return self._example_values
+
+    @example_values.setter
+    def example_values(self, values: Dict[str, Any]):
+        self._example_values = values
+        # Zero-width alternation reports every hint found in a name in one scan
+        self._hint_re = re.compile('(?=(%s))' % '|'.join(map(re.escape, values)))
+        # (param_type, param_name) -> matching example_values key, or None
+        self._hint_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
     def generate_example_for_endpoint(self, endpoint_path: str, method: str, params: Dict) -> ApiExample:
         """Generate example request/response for an endpoint"""
         
@@ -78,94 +110,106 @@ class ExampleGenerator:
 
     def get_example_value(self, param_type: str, param_name: str) -> Any:
         """Get example value based on parameter type and name"""
+        cache_key = (param_type, param_name)
+        if cache_key in self._hint_cache:
+            key = self._hint_cache[cache_key]
+        else:
+            key = self._hint_cache[cache_key] = self._match_hint(param_type, param_name)
+        if key is None:
+            return 'example_value'
+        return self.example_values[key]
+
+    def _match_hint(self, param_type: str, param_name: str) -> Optional[str]:
+        """Find the example_values key that applies to a parameter"""
         
-        # Check if we have a specific example for this parameter name
-        for key in self.example_values:
-            if key in param_name.lower():
-                return self.example_values[key]
+        # Check if we have a specific example for this parameter name; the first
+        # hint in declaration order wins, not the leftmost match in the name
+        found = {m.group(1) for m in self._hint_re.finditer(param_name.lower())}
+        if found:
+            for key in self.example_values:
+                if key in found:
+                    return key
 
         # Default to type-based examples
-        return self.example_values.get(param_type, 'example_value')
+        return param_type if param_type in self.example_values else None
 
 class ApiDocGenerator:
-    def __init__(self):
+    def __init__(self, generated_on: Optional[datetime] = None):
+        # Formatted once; every page from a run carries the same timestamp
+        self.generated_on = (generated_on or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
         self.validation_rules = {
             "ip": ValidationRule(
                 type="ip",
-                pattern=r"^(\d{1,3}\.){3}\d{1,3}(/\d{1,2})?$",
+                pattern=_COMPILED_PATTERNS['ip'].pattern,
                 description="IPv4 address with optional CIDR",
                 example="192.168.88.1"
             ),
             "mac": ValidationRule(
                 type="mac",
-                pattern=r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$",
+                pattern=_COMPILED_PATTERNS['mac'].pattern,
                 description="MAC address in XX:XX:XX:XX:XX:XX format",
                 example="00:0C:29:45:67:89"
             ),
             "interface": ValidationRule(
                 type="interface",
-                pattern=r"^[a-zA-Z0-9-_]+$",
+                pattern=_COMPILED_PATTERNS['interface'].pattern,
                 description="Interface name",
                 example="ether1"
             )
         }
+        self.validation_rule_dicts = {k: asdict(v) for k, v in self.validation_rules.items()}
         self.example_generator = ExampleGenerator()
 
     def generate_markdown(self, endpoint_data: Dict, path: str) -> str:
         """Generate markdown documentation for endpoint"""
-        md = [
-            f"# {path} API Documentation\n",
-            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# {path} API Documentation\n")
+        w(f"Generated on: {self.generated_on}\n")
 
         if 'description' in endpoint_data:
-            md.extend([
-                "## Description\n",
-                f"{endpoint_data['description']}\n"
-            ])
+            w("## Description\n")
+            w(f"{endpoint_data['description']}\n")
 
-        md.append("## Endpoints\n")
+        w("## Endpoints\n")
 
         for method, details in endpoint_data.get('endpoints', {}).items():
-            md.extend([
-                f"### {method.upper()}\n",
-                "#### Parameters\n",
-                "| Name | Type | Required | Description |\n",
-                "|------|------|----------|-------------|\n"
-            ])
+            w(f"### {method.upper()}\n")
+            w("#### Parameters\n")
+            w("| Name | Type | Required | Description |\n")
+            w("|------|------|----------|-------------|\n")
 
             # Add parameters
             if 'parameters' in details:
                 for param, param_details in details['parameters'].items():
                     required = "Yes" if param_details.get('required', False) else "No"
                     desc = param_details.get('description', '')
-                    md.append(f"| {param} | {param_details.get('type', '')} | {required} | {desc} |\n")
+                    w(f"| {param} | {param_details.get('type', '')} | {required} | {desc} |\n")
 
             # Add examples
             if 'examples' in details:
-                md.extend([
-                    "\n#### Examples\n",
-                    "```json\n",
-                    json.dumps(details['examples'], indent=2),
-                    "\n```\n"
-                ])
+                w("\n#### Examples\n")
+                w("```json\n")
+                w(fast_json.dumps_text(details['examples']))
+                w("\n```\n")
 
             # Add validation rules if any
             if 'validation' in details:
-                md.extend([
-                    "\n#### Validation Rules\n",
-                    "```json\n",
-                    json.dumps(details['validation'], indent=2),
-                    "\n```\n"
-                ])
+                w("\n#### Validation Rules\n")
+                w("```json\n")
+                w(fast_json.dumps_text(details['validation']))
+                w("\n```\n")
 
-        return ''.join(md)
+        return buf.getvalue()
 
 class EnhancedRamlSplitter:
-    def __init__(self, output_dir: str = "api"):
+    def __init__(self, output_dir: str = "api", started_at: Optional[datetime] = None):
         self.output_dir = output_dir
         self.base_path = Path(output_dir)
-        self.doc_generator = ApiDocGenerator()
+        self.started_at = started_at or datetime.now()
+        self.doc_generator = ApiDocGenerator(generated_on=self.started_at)
+        self._seen_dirs: Set[Path] = set()
+        self._family_indexes: List[Dict] = []
         
     def process_raml(self, input_file: str):
         """Main method to process RAML file"""
@@ -196,23 +240,35 @@ class EnhancedRamlSplitter:
             self.base_path / 'examples'
         ]
         for dir_path in dirs:
-            dir_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(dir_path)
             logging.info(f"Created directory: {dir_path}")
 
+    def _ensure_dir(self, dir_path: Path):
+        """Create directory once per run, skipping paths already created"""
+        if dir_path not in self._seen_dirs:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._seen_dirs.add(dir_path)
+
     def load_raml(self, file_path: str) -> Dict:
         """Load RAML file"""
-        with open(file_path, 'r') as f:
-            return yaml.safe_load(f)
+        # Imported here so entry points that never load RAML skip loading PyYAML
+        import yaml
+
+        # Prefer libyaml's C loader when PyYAML was built against it
+        loader = yaml.CSafeLoader if hasattr(yaml, 'CSafeLoader') else yaml.SafeLoader
+        return yaml.load(Path(file_path).read_bytes(), Loader=loader)
 
     def split_raml(self, raml_content: Dict):
         """Split RAML into separate files"""
+        # Start a fresh main index so repeated runs don't list families twice
+        self._family_indexes = []
         for family, endpoints in raml_content.items():
             if family.startswith('/'):
                 family_dir = self.create_family_directory(family.strip('/'))
                 self.process_family(family, endpoints, family_dir)
 
-    def process_family(self, family: str, endpoints: Dict, family_dir: Path):
-        """Process a family of endpoints"""
+    def process_family(self, family: str, endpoints: Dict, family_dir: Path) -> Dict:
+        """Process a family of endpoints and record it for the main index"""
         logging.info(f"Processing family: {family}")
         
         # Create family index
@@ -229,8 +285,9 @@ class EnhancedRamlSplitter:
                 family_index["endpoints"].append(processed_endpoint)
 
         # Write family index
-        with open(family_dir / '_index.json', 'w') as f:
-            json.dump(family_index, f, indent=2)
+        self._family_indexes.append(family_index)
+        (family_dir / '_index.json').write_bytes(fast_json.dumps(family_index))
+        return family_index
 
     def process_endpoint(self, endpoint: str, data: Dict, family_dir: Path) -> Dict:
         """Process single endpoint"""
@@ -247,58 +304,47 @@ class EnhancedRamlSplitter:
         enhanced_data = {
             "endpoint": endpoint,
             "data": data,
-            "examples": examples.__dict__,
+            "examples": examples,
             "validation": self.get_validation_rules(data)
         }
 
         # Write endpoint file
         endpoint_file = family_dir / f"{endpoint.strip('/')}.json"
-        with open(endpoint_file, 'w') as f:
-            json.dump(enhanced_data, f, indent=2)
+        endpoint_file.write_bytes(fast_json.dumps(enhanced_data))
 
         # Generate documentation
         doc_file = family_dir / 'docs' / f"{endpoint.strip('/')}.md"
         doc_content = self.doc_generator.generate_markdown(enhanced_data, endpoint)
-        with open(doc_file, 'w') as f:
-            f.write(doc_content)
+        doc_file.write_text(doc_content, encoding='utf-8')
 
         return enhanced_data
 
     def get_validation_rules(self, data: Dict) -> Dict:
         """Get validation rules for endpoint parameters"""
         rules = {}
+        rule_dicts = self.doc_generator.validation_rule_dicts
         for param, details in data.get('parameters', {}).items():
             param_type = details.get('type', 'string')
-            if param_type in self.doc_generator.validation_rules:
-                rules[param] = self.doc_generator.validation_rules[param_type].__dict__
+            if param_type in rule_dicts:
+                rules[param] = rule_dicts[param_type]
         return rules
 
     def create_family_directory(self, family: str) -> Path:
         """Create and return family directory"""
         family_dir = self.base_path / family
-        family_dir.mkdir(parents=True, exist_ok=True)
-        (family_dir / 'docs').mkdir(exist_ok=True)
+        self._ensure_dir(family_dir)
+        self._ensure_dir(family_dir / 'docs')
         return family_dir
 
     def generate_index(self):
         """Generate main index file"""
         index = {
-            "generated_at": datetime.now().isoformat(),
-            "families": []
+            "generated_at": self.started_at.isoformat(),
+            "families": self._family_indexes
         }
 
-        # Collect all families
-        for family_dir in self.base_path.glob('*/'):
-            if family_dir.is_dir() and not family_dir.name.startswith('.'):
-                index_file = family_dir / '_index.json'
-                if index_file.exists():
-                    with open(index_file) as f:
-                        family_data = json.load(f)
-                        index["families"].append(family_data)
-
         # Write main index
-        with open(self.base_path / 'index.json', 'w') as f:
-            json.dump(index, f, indent=2)
+        (self.base_path / 'index.json').write_bytes(fast_json.dumps(index))
 
 def main():
     # Define paths
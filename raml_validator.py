@@ -1,18 +1,25 @@
-import json
-import yaml
+import fast_json
 import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict
 import logging
 
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Required markdown sections, matched against raw bytes so files need no decoding
+_REQUIRED_SECTION_BYTES = [(s, s.encode()) for s in ['# ', '## Description', '## Endpoints']]
+
 class RamlValidator:
     def __init__(self, api_dir: str = "api"):
         self.api_dir = Path(api_dir)
         self.errors = []
         self.warnings = []
+        self._json_files = None
+        self._md_files = None
+        self._example_files = None
+        self._family_dirs = None
+        self._dir_entries = None
         
     def validate_all(self) -> bool:
         """Run all validations"""
@@ -37,50 +44,94 @@ class RamlValidator:
 
     def validate_directory_structure(self):
         """Validate basic directory structure"""
+        self._scan()
+        root = str(self.api_dir)
         required_dirs = ['docs', 'examples']
         for dir_name in required_dirs:
-            if not (self.api_dir / dir_name).exists():
+            if not self._has_entry(root, dir_name):
                 self.errors.append(f"Missing required directory: {dir_name}")
 
         # Check each family directory
-        for family_dir in self.api_dir.glob('*/'):
-            if family_dir.is_dir() and not family_dir.name.startswith('.'):
-                if not (family_dir / 'docs').exists():
-                    self.errors.append(f"Missing docs directory in {family_dir.name}")
-                if not (family_dir / '_index.json').exists():
-                    self.errors.append(f"Missing _index.json in {family_dir.name}")
+        for family_dir in self._family_dirs:
+            if not self._has_entry(family_dir.path, 'docs'):
+                self.errors.append(f"Missing docs directory in {family_dir.name}")
+            if not self._has_entry(family_dir.path, '_index.json'):
+                self.errors.append(f"Missing _index.json in {family_dir.name}")
+
+    def _scan(self):
+        """Walk api_dir once, bucketing files and recording directory listings.
+
+        Every validator reads from these buckets instead of globbing the tree
+        itself. Symlinked directories are listed by name but not descended
+        into, as with rglob.
+        """
+        if self._json_files is not None:
+            return
+        self._json_files, self._md_files, self._example_files = [], [], []
+        self._family_dirs = []
+        self._dir_entries = {}
+        if not self.api_dir.is_dir():
+            return
+
+        root = str(self.api_dir)
+        examples_dir = os.path.join(root, 'examples')
+        pending = [root]
+        while pending:
+            top = pending.pop()
+            names = self._dir_entries[top] = set()
+            with os.scandir(top) as it:
+                for entry in it:
+                    names.add(entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith('.json'):
+                        self._json_files.append((entry.path, entry.name))
+                        if top == examples_dir:
+                            self._example_files.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        self._md_files.append(entry.path)
+
+                    if top == root and not entry.name.startswith('.') and entry.is_dir():
+                        self._family_dirs.append(entry)
+
+    def _has_entry(self, dir_path: str, name: str) -> bool:
+        """Check whether name exists in dir_path, using the scanned listing when available"""
+        names = self._dir_entries.get(dir_path)
+        if names is None:
+            return os.path.exists(os.path.join(dir_path, name))
+        return name in names
 
     def validate_json_files(self):
         """Validate all JSON files"""
-        for json_file in self.api_dir.rglob('*.json'):
+        self._scan()
+        for json_file, name in self._json_files:
             try:
-                with open(json_file) as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    data = fast_json.loads(f.read())
                 
                 # Validate required fields based on file type
-                if json_file.name == '_index.json':
+                if name == '_index.json':
                     self._validate_index_file(data, json_file)
-                elif json_file.name.endswith('.json'):
+                else:
                     self._validate_endpoint_file(data, json_file)
                     
-            except json.JSONDecodeError as e:
+            except fast_json.JSONDecodeError as e:
                 self.errors.append(f"Invalid JSON in {json_file}: {str(e)}")
             except Exception as e:
                 self.errors.append(f"Error processing {json_file}: {str(e)}")
 
-    def _validate_index_file(self, data: Dict, file_path: Path):
+    def _validate_index_file(self, data: Dict, file_path: str):
         """Validate index file structure"""
         required_fields = ['family', 'endpoints']
         for field in required_fields:
             if field not in data:
                 self.errors.append(f"Missing required field '{field}' in {file_path}")
 
-    def _validate_endpoint_file(self, data: Dict, file_path: Path):
+    def _validate_endpoint_file(self, data: Dict, file_path: str):
         """Validate endpoint file structure"""
         required_fields = ['endpoint', 'data']
-        for field in required_fields:
-            if field not in data:
-                self.errors.append(f"Missing required field '{field}' in {file_path}")
+        for field in [f for f in required_fields if f not in data]:
+            self.errors.append(f"Missing required field '{field}' in {file_path}")
                 
         # Validate examples if present
         if 'examples' in data:
@@ -88,25 +139,27 @@ class RamlValidator:
 
     def validate_markdown_files(self):
         """Validate markdown documentation files"""
-        for md_file in self.api_dir.rglob('*.md'):
+        self._scan()
+        for md_file in self._md_files:
             try:
-                content = md_file.read_text()
+                with open(md_file, 'rb') as f:
+                    content = f.read()
                 
                 # Check for required sections
-                required_sections = ['# ', '## Description', '## Endpoints']
-                for section in required_sections:
-                    if section not in content:
-                        self.warnings.append(f"Missing section '{section}' in {md_file}")
+                missing = [s for s, b in _REQUIRED_SECTION_BYTES if b not in content]
+                for section in missing:
+                    self.warnings.append(f"Missing section '{section}' in {md_file}")
                         
             except Exception as e:
                 self.errors.append(f"Error reading markdown file {md_file}: {str(e)}")
 
     def validate_examples(self):
         """Validate example files and data"""
-        for json_file in (self.api_dir / 'examples').glob('*.json'):
+        self._scan()
+        for json_file in self._example_files:
             try:
-                with open(json_file) as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    data = fast_json.loads(f.read())
                     
                 # Validate example structure
                 required_fields = ['request', 'response']
@@ -121,8 +174,7 @@ class RamlValidator:
         """Validate cross-references between files"""
         # Load main index
         try:
-            with open(self.api_dir / 'index.json') as f:
-                main_index = json.load(f)
+            main_index = fast_json.loads((self.api_dir / 'index.json').read_bytes())
                 
             # Check each family referenced exists
             for family in main_index.get('families', []):
@@ -136,15 +188,15 @@ class RamlValidator:
     def validate_index_files(self):
         """Validate main index and family indexes"""
         # Validate main index
+        self._scan()
         main_index_path = self.api_dir / 'index.json'
-        if not main_index_path.exists():
+        if not self._has_entry(str(self.api_dir), 'index.json'):
             self.errors.append("Missing main index.json")
         else:
             try:
-                with open(main_index_path) as f:
-                    data = json.load(f)
-                    if 'families' not in data:
-                        self.errors.append("Missing 'families' in main index.json")
+                data = fast_json.loads(main_index_path.read_bytes())
+                if 'families' not in data:
+                    self.errors.append("Missing 'families' in main index.json")
             except Exception as e:
                 self.errors.append(f"Error validating main index.json: {str(e)}")
 